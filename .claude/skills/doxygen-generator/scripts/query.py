@@ -25,19 +25,52 @@ Examples:
 """
 
 import argparse
+import collections
+import concurrent.futures
 import difflib
+import fnmatch
+import functools
+import itertools
 import json
+import math
+import mmap
 import os
 import re
 import sqlite3
 import sys
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field, asdict
+import tempfile
+import zlib
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Iterator, Optional
-
-
-@dataclass
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+# Prefer lxml; the stdlib ElementTree is C-accelerated as well.  Only the
+# API subset shared by both (parse, iterparse, find/findall/findtext, get,
+# iter, itertext, ParseError) is used below.
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    _HAVE_LXML = False
+    import xml.etree.ElementTree as ET
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_process = None
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+try:
+    import re._parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse as _sre_parse
+
+
+@dataclass(slots=True)
 class SymbolInfo:
     """Parsed information about a Doxygen-documented symbol."""
     id: str
@@ -55,13 +88,25 @@ class SymbolInfo:
     referenced_by: list[str] = field(default_factory=list)    # symbols that call this
 
 
+_SYMBOL_FIELDS = tuple(f.name for f in fields(SymbolInfo))
+
+
 # --- Utility helpers ---
 
 def symbol_to_dict(sym: SymbolInfo, compact: bool = False) -> dict:
-    """Convert SymbolInfo to dict, optionally stripping empty/zero fields."""
-    d = asdict(sym)
-    if compact:
-        return {k: v for k, v in d.items() if v}
+    """Convert SymbolInfo to dict, optionally stripping empty/zero fields.
+
+    All fields are already JSON-native, so a shallow field-by-field copy
+    replaces dataclasses.asdict() and its recursive deep copy.  List fields
+    are copied so the result never aliases the symbol's own lists.
+    """
+    d = {}
+    for k in _SYMBOL_FIELDS:
+        v = getattr(sym, k)
+        if type(v) is list:
+            v = v[:]
+        if v or not compact:
+            d[k] = v
     return d
 
 
@@ -69,7 +114,12 @@ def _paginate(items: list, limit: int, offset: int) -> tuple[list, dict]:
     """Paginate a list. Returns (page, meta) with truncation info."""
     total = len(items)
     page = items[offset:offset + limit] if limit > 0 else items[offset:]
-    truncated = (offset + len(page)) < total
+    return page, _page_meta(total, limit, offset, len(page))
+
+
+def _page_meta(total: int, limit: int, offset: int, page_len: int) -> dict:
+    """Pagination metadata for a page of ``page_len`` items out of ``total``."""
+    truncated = (offset + page_len) < total
     meta = {
         "total": total,
         "offset": offset,
@@ -83,13 +133,281 @@ def _paginate(items: list, limit: int, offset: int) -> tuple[list, dict]:
             f"Use --offset {next_offset} to see next "
             f"{min(remaining, limit)} of {remaining} remaining results."
         )
-    return page, meta
+    return meta
+
+
+_encode_json_str = json.encoder.encode_basestring_ascii
+_encode_json_scalar = json.JSONEncoder().encode  # no indent: uses the C encoder
+
+
+def _dumps(obj, level: int = 0) -> str:
+    """Return ``json.dumps(obj, indent=2)``, byte for byte, but faster.
+
+    With ``indent`` set, the stdlib falls back to its pure-Python encoder.
+    Here plain dicts and lists are laid out directly and leaves go through
+    the C string/scalar encoders; lists of strings (reference lists, file
+    names) are joined in one pass.  ``level`` is the starting nesting depth.
+    """
+    t = type(obj)
+    if t is dict:
+        if not obj:
+            return "{}"
+        inner = "\n" + "  " * (level + 1)
+        parts = []
+        for k, v in obj.items():
+            tv = type(v)
+            if tv is str:
+                v = _encode_json_str(v)
+            elif tv is int:
+                v = int.__repr__(v)
+            else:
+                v = _dumps(v, level + 1)
+            if type(k) is not str:
+                k = _encode_json_scalar(k)  # JSON keys are strings: 1 -> "1"
+            parts.append(_encode_json_str(k) + ": " + v)
+        return "{" + inner + ("," + inner).join(parts) + "\n" + "  " * level + "}"
+    if t is list or t is tuple:
+        if not obj:
+            return "[]"
+        inner = "\n" + "  " * (level + 1)
+        if all(type(v) is str for v in obj):
+            items = map(_encode_json_str, obj)
+        else:
+            items = [_dumps(v, level + 1) for v in obj]
+        return "[" + inner + ("," + inner).join(items) + "\n" + "  " * level + "]"
+    if isinstance(obj, (dict, list, tuple)):  # subclasses: defer to the stdlib
+        return json.dumps(obj, indent=2).replace("\n", "\n" + "  " * level)
+    return _encode_json_scalar(obj)
+
+
+def _print_json_results(meta: dict, results: Iterable[dict]) -> None:
+    """Print ``{**meta, "results": [...]}`` exactly as json.dumps(indent=2) would.
+
+    Results are serialized and written one at a time, so the whole document
+    is never held as a single string.
+    """
+    write = sys.stdout.write
+    if meta:
+        write(_dumps(meta)[:-2] + ',\n  "results": [')
+    else:
+        write('{\n  "results": [')
+    sep = "\n    "
+    for item in results:
+        write(sep + _dumps(item, 2))
+        sep = ",\n    "
+    write("]\n}\n" if sep == "\n    " else "\n  ]\n}\n")
+
+
+def _filter_by_name(symbols: list[SymbolInfo], regex: re.Pattern,
+                    names: Optional[list[str]] = None) -> list[SymbolInfo]:
+    """Return symbols whose name matches ``regex``.
+
+    map() + compress() keep the per-symbol loop in C instead of a Python
+    list comprehension.  ``names``, if given, must parallel ``symbols``.
+    """
+    if names is None:
+        names = [s.name for s in symbols]
+    return list(itertools.compress(symbols, map(regex.search, names)))
+
+
+_EMPTY_POSTING: frozenset[int] = frozenset()
+
+
+class _TrigramIndex:
+    """Inverted index from 3-char substrings to name positions.
+
+    Used as a prefilter for substring/regex search (the Code Search
+    technique): a name can only contain a literal if it contains every
+    trigram of that literal, so intersecting posting lists yields a small
+    candidate set that the real matcher then verifies.
+
+    Names with non-ASCII characters are always candidates: under
+    re.IGNORECASE an ASCII letter can match one of them (``s`` matches
+    ``\u017f``, ``k`` the Kelvin sign), which lower() does not fold.
+    """
+
+    def __init__(self, lower_names: list[str]):
+        self._postings: dict[str, set[int]] = {}
+        self._non_ascii: set[int] = set()
+        for i, name in enumerate(lower_names):
+            if not name.isascii():
+                self._non_ascii.add(i)
+            for j in range(len(name) - 2):
+                self._postings.setdefault(name[j:j + 3], set()).add(i)
+
+    def candidates(self, literals: Iterable[str]) -> Optional[set[int]]:
+        """Return positions of names that may contain all ``literals``.
+
+        Returns None when no literal is long enough to constrain the search
+        (caller must scan everything).
+        """
+        result: Optional[set[int]] = None
+        for literal in literals:
+            for j in range(len(literal) - 2):
+                posting = self._postings.get(literal[j:j + 3], _EMPTY_POSTING)
+                result = set(posting) if result is None else result & posting
+                if not result:
+                    return set(self._non_ascii)
+        return result if result is None else result | self._non_ascii
+
+
+def _regex_literals(regex: re.Pattern) -> list[str]:
+    """Extract lowercased literal runs that every match of ``regex`` must contain.
+
+    Only walks plain literal sequences and non-repeated groups; anything
+    else (alternation, classes, repeats) just ends the current run, so the
+    result is always a safe under-approximation.  Non-ASCII characters end
+    a run too: re.IGNORECASE folds some of them to ASCII letters (``\u017f``
+    matches ``s``), which lower() would miss.
+    """
+    try:
+        parsed = _sre_parse.parse(regex.pattern, regex.flags)
+    except Exception:
+        return []
+
+    literals: list[str] = []
+
+    def _walk(items) -> None:
+        run: list[str] = []
+        for op, arg in items:
+            if op is _sre_parse.LITERAL and arg < 0x80:
+                run.append(chr(arg))
+                continue
+            if run:
+                literals.append("".join(run).lower())
+                run = []
+            if op is _sre_parse.SUBPATTERN:
+                _walk(arg[-1])
+        if run:
+            literals.append("".join(run).lower())
+
+    _walk(parsed)
+    return [lit for lit in literals if len(lit) >= 3]
 
 
 def _did_you_mean(index, name: str, n: int = 5) -> list[str]:
     """Return fuzzy matches for a symbol name."""
-    all_names = index.get_all_names()
-    return difflib.get_close_matches(name, all_names, n=n, cutoff=0.6)
+    cutoff = 0.6
+    # ratio() = 2*M/(len(a)+len(b)) <= 2*min/(sum), so names outside this
+    # length band can never reach ``cutoff``; skip them without scoring.
+    min_len = math.floor(len(name) * cutoff / (2 - cutoff))
+    max_len = math.ceil(len(name) * (2 - cutoff) / cutoff)
+    candidates = index.get_all_names(min_len=min_len, max_len=max_len)
+    return _close_matches(name, candidates, n=n, cutoff=cutoff)
+
+
+def _close_matches(word: str, possibilities: list[str], n: int, cutoff: float) -> list[str]:
+    """Like difflib.get_close_matches(), using RapidFuzz's C scorer when installed.
+
+    fuzz.ratio is the same 2*M/T similarity as SequenceMatcher.ratio(),
+    scaled to 0-100.  ``processor=None`` is explicit because rapidfuzz<3
+    otherwise lowercases and strips punctuation before scoring.
+    """
+    if _rf_process is not None:
+        return [match for match, _score, _idx in _rf_process.extract(
+            word, possibilities, scorer=_rf_fuzz.ratio, processor=None,
+            limit=n, score_cutoff=cutoff * 100,
+        )]
+    return difflib.get_close_matches(word, possibilities, n=n, cutoff=cutoff)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_name_regex(pattern: str) -> re.Pattern:
+    """Compile a case-insensitive symbol-name regex, memoized per pattern."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _sqlite_regexp(pattern: str, value: Optional[str]) -> bool:
+    """Implementation of SQLite's ``X REGEXP Y`` operator (case-insensitive)."""
+    return value is not None and _compile_name_regex(pattern).search(value) is not None
+
+
+def _sqlite_py_lower(value: Optional[str]) -> Optional[str]:
+    """SQL ``PY_LOWER(X)``: Python's str.lower(), which (unlike SQLite's
+    lower()/LIKE) folds non-ASCII letters too."""
+    return value.lower() if isinstance(value, str) else value
+
+
+def _like_escape(text: str) -> str:
+    """Escape LIKE wildcards so ``text`` matches literally (with ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _prefix_range(column: str, prefix: str) -> tuple[str, list[str]]:
+    """SQL condition (and params) for ``column.startswith(prefix)``.
+
+    Expressed as a half-open range ``[prefix, successor)`` so SQLite can
+    walk an index on ``column``; UTF-8 byte order (the BINARY collation)
+    matches code point order, so bumping the last code point bounds every
+    string that starts with ``prefix``.
+    """
+    stem = prefix
+    while stem:
+        last = ord(stem[-1]) + 1
+        if last == 0xD800:          # skip the surrogate block
+            last = 0xE000
+        if last <= 0x10FFFF:
+            return f"{column} >= ? AND {column} < ?", [prefix, stem[:-1] + chr(last)]
+        stem = stem[:-1]
+    return f"{column} >= ?", [prefix]
+
+
+# Max source files whose line-start offsets _read_line_range() remembers.
+_LINE_STARTS_CACHE_SIZE = 32
+
+# str(path) -> (st_mtime_ns, st_size, byte offsets of the lines scanned so far)
+_line_starts_cache: "collections.OrderedDict[str, tuple[int, int, list[int]]]" = \
+    collections.OrderedDict()
+
+
+def _read_line_range(path: Path, start: int, end: int) -> list[str]:
+    """Return lines ``[start, end)`` (0-based) of a text file.
+
+    The file is memory-mapped and newlines are scanned only up to line
+    ``end``, so only the requested slice is decoded and split.  Line-start
+    offsets are kept in a small LRU (validated by mtime and size), so later
+    calls on the same file only scan past what was already seen.  A negative
+    ``end`` keeps list-slice semantics (relative to EOF).
+    """
+    if end < 0:
+        return path.read_text().splitlines()[start:end]
+
+    st = path.stat()
+    key = str(path)
+    cached = _line_starts_cache.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        starts = cached[2]
+        _line_starts_cache.move_to_end(key)
+    else:
+        starts = [0]
+        _line_starts_cache[key] = (st.st_mtime_ns, st.st_size, starts)
+        if len(_line_starts_cache) > _LINE_STARTS_CACHE_SIZE:
+            _line_starts_cache.popitem(last=False)
+
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            return []
+    with mm:
+        size = len(mm)
+        pos = starts[-1]
+        while len(starts) <= end and pos < size:
+            nl = mm.find(b"\n", pos)
+            pos = size if nl == -1 else nl + 1
+            starts.append(pos)
+        if start >= len(starts):
+            return []
+        begin = starts[start]
+        stop = starts[end] if end < len(starts) else starts[-1]
+        if begin >= stop:
+            return []
+        text = mm[begin:stop].decode("utf-8")
+
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return [line.rstrip("\r") for line in lines]
 
 
 # --- Standalone XML helpers (usable by both in-memory and SQLite indexes) ---
@@ -98,59 +416,124 @@ def _get_text(elem: Optional[ET.Element]) -> str:
     """Extract all text content from an element recursively."""
     if elem is None:
         return ""
+    # Leaf fast path: <name>, <type>, <declname> etc. rarely have children,
+    # so skip the itertext() generator and its per-fragment allocations.
+    if len(elem) == 0:
+        return (elem.text or "").strip()
+    if _HAVE_LXML:
+        # libxml2's text serializer walks the subtree in C
+        return ET.tostring(elem, method="text", encoding="unicode", with_tail=False).strip()
     return "".join(elem.itertext()).strip()
 
 
-def _parse_memberdef_element(memberdef: ET.Element) -> SymbolInfo:
-    """Parse a <memberdef> element into a SymbolInfo (standalone)."""
-    sym = SymbolInfo(
-        id=memberdef.get("id", ""),
-        name=_get_text(memberdef.find("name")),
-        kind=memberdef.get("kind", ""),
-    )
-
-    location = memberdef.find("location")
+def _set_location(sym: SymbolInfo, location: Optional[ET.Element]) -> None:
+    """Copy file/line/body range from a <location> element onto ``sym``."""
     if location is not None:
-        sym.file = location.get("file", "")
+        sym.file = sys.intern(location.get("file", ""))
         sym.line = int(location.get("line", "0"))
         sym.body_start = int(location.get("bodystart", "0"))
         sym.body_end = int(location.get("bodyend", "0"))
 
-    sym.return_type = _get_text(memberdef.find("type"))
-
-    params = []
-    for param in memberdef.findall("param"):
-        ptype = _get_text(param.find("type"))
-        pname = _get_text(param.find("declname"))
-        if ptype or pname:
-            params.append(f"{ptype} {pname}".strip())
-    sym.params = ", ".join(params)
 
-    sym.brief = _get_text(memberdef.find("briefdescription"))
-    sym.detailed = _get_text(memberdef.find("detaileddescription"))
+def _parse_memberdef_element(memberdef: ET.Element, shallow: bool = False,
+                             detailed: bool = True) -> SymbolInfo:
+    """Parse a <memberdef> element into a SymbolInfo (standalone).
 
-    for ref in memberdef.findall("references"):
-        ref_name = _get_text(ref)
-        if ref_name:
-            sym.references.append(ref_name)
+    With ``shallow``, only id/name/kind/location are extracted; that is all
+    listing, searching and stats need.  Types, params, descriptions and
+    references are skipped.  With ``detailed=False`` everything but the
+    (often large) detaileddescription is parsed.
+    """
+    if shallow:
+        sym = SymbolInfo(
+            id=memberdef.get("id", ""),
+            name=_get_text(memberdef.find("name")),
+            kind=sys.intern(memberdef.get("kind", "")),
+        )
+        _set_location(sym, memberdef.find("location"))
+        return sym
 
-    for ref in memberdef.findall("referencedby"):
-        ref_name = _get_text(ref)
-        if ref_name:
-            sym.referenced_by.append(ref_name)
+    sym = SymbolInfo(
+        id=memberdef.get("id", ""),
+        name="",
+        kind=sys.intern(memberdef.get("kind", "")),
+    )
 
+    # One pass over the children instead of a find()/findall() scan per tag.
+    # The first occurrence wins for single-valued tags, as with find().
+    name_e = type_e = brief_e = detailed_e = location = None
+    params = []
+    for child in memberdef:
+        tag = child.tag
+        if tag == "param":
+            ptype = pname = ""
+            for sub in child:
+                if sub.tag == "type" and not ptype:
+                    ptype = _get_text(sub)
+                elif sub.tag == "declname" and not pname:
+                    pname = _get_text(sub)
+            if ptype or pname:
+                params.append(f"{ptype} {pname}".strip())
+        elif tag == "references":
+            ref_name = _get_text(child)
+            if ref_name:
+                sym.references.append(ref_name)
+        elif tag == "referencedby":
+            ref_name = _get_text(child)
+            if ref_name:
+                sym.referenced_by.append(ref_name)
+        elif tag == "name":
+            if name_e is None:
+                name_e = child
+        elif tag == "type":
+            if type_e is None:
+                type_e = child
+        elif tag == "briefdescription":
+            if brief_e is None:
+                brief_e = child
+        elif tag == "detaileddescription":
+            if detailed_e is None and detailed:
+                detailed_e = child
+        elif tag == "location":
+            if location is None:
+                location = child
+
+    sym.name = _get_text(name_e)
+    _set_location(sym, location)
+
+    sym.return_type = _get_text(type_e)
+    sym.params = ", ".join(params)
+    sym.brief = _get_text(brief_e)
+    sym.detailed = _get_text(detailed_e)
     return sym
 
 
-def _iterparse_compound(xml_path: Path) -> Iterator[SymbolInfo]:
+def _iterparse_compound(xml_path: Path,
+                        skip_ids: frozenset[str] = frozenset(),
+                        shallow: bool = False) -> Iterator[SymbolInfo]:
     """Stream-parse a Doxygen compound XML file, yielding SymbolInfo per memberdef.
 
     Uses ET.iterparse with elem.clear() to avoid holding full trees in memory.
+    Memberdefs whose id is in ``skip_ids`` are cleared without being parsed.
     """
+    if _HAVE_LXML:
+        # lxml filters on the tag in C and can drop already-seen siblings
+        try:
+            for _, elem in ET.iterparse(str(xml_path), events=("end",),
+                                        tag="memberdef", huge_tree=True):
+                if elem.get("id", "") not in skip_ids:
+                    yield _parse_memberdef_element(elem, shallow)
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except ET.ParseError:
+            return
+        return
     try:
         for event, elem in ET.iterparse(str(xml_path), events=("end",)):
             if elem.tag == "memberdef":
-                yield _parse_memberdef_element(elem)
+                if elem.get("id", "") not in skip_ids:
+                    yield _parse_memberdef_element(elem, shallow)
                 elem.clear()
             elif elem.tag == "compounddef":
                 # Clear the compound to free accumulated sub-elements
@@ -159,49 +542,239 @@ def _iterparse_compound(xml_path: Path) -> Iterator[SymbolInfo]:
         return
 
 
-def _parse_compound_members(xml_dir: Path, compound_refid: str) -> Optional[list[dict]]:
-    """Parse memberdef elements from a compound XML file.
+def _scan_xml_dir(xml_dir: Path) -> tuple[float, int]:
+    """Return ``(newest mtime, count)`` of ``*.xml`` files in one scandir pass."""
+    newest = 0.0
+    count = 0
+    try:
+        with os.scandir(xml_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(".xml") or name.startswith("."):
+                    continue
+                count += 1
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime > newest:
+                    newest = mtime
+    except OSError:
+        pass
+    return newest, count
+
+
+# Compound files each extra worker process must have to pay for its startup
+# (~20 ms to spawn vs. about a millisecond to parse a typical compound).
+_PARALLEL_MIN_COMPOUNDS = 32
+
+
+def _usable_cpus() -> int:
+    """CPUs this process may run on (affinity-aware where supported)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+# Max parsed compound trees kept in memory by DoxygenXMLIndex (LRU).
+_COMPOUND_CACHE_SIZE = 256
+
+# Bump when the parse-cache layout or SymbolInfo fields change.
+_PARSE_CACHE_VERSION = 3
+
+# Expected type of each SymbolInfo field in a parse-cache row.
+_PARSE_CACHE_ROW_TYPES = (str, str, str, str, int, int, int,
+                          str, str, str, str, list, list)
 
-    Returns list of member dicts, or None if file not found.
+
+def _parse_one_compound(xml_dir: Path, refid: str,
+                        skip_ids: frozenset[str] = frozenset(),
+                        shallow: bool = False) -> list[SymbolInfo]:
+    """Parse all memberdefs of one compound file (process-pool worker).
+
+    Must stay a top-level function so it can be pickled by ProcessPoolExecutor.
     """
-    xml_path = xml_dir / f"{compound_refid}.xml"
+    xml_path = xml_dir / f"{refid}.xml"
     if not xml_path.exists():
-        return None
+        return []
+    return list(_iterparse_compound(xml_path, skip_ids, shallow))
 
-    try:
-        tree = ET.parse(str(xml_path))
-    except ET.ParseError:
-        return None
-
-    root = tree.getroot()
-    compounddef = root.find(".//compounddef")
-    if compounddef is None:
-        return None
-
-    members = []
-    for memberdef in compounddef.iter("memberdef"):
-        member = {
-            "name": _get_text(memberdef.find("name")),
-            "kind": memberdef.get("kind", ""),
-            "type": _get_text(memberdef.find("type")),
-            "brief": _get_text(memberdef.find("briefdescription")),
-        }
-        loc = memberdef.find("location")
-        if loc is not None:
-            member["line"] = int(loc.get("line", "0"))
-        members.append(member)
 
-    return members
+def _parse_compounds(xml_dir: Path, refids: list[str],
+                     skip_ids: Optional[dict[str, frozenset[str]]] = None,
+                     shallow: bool = False,
+                     ) -> Iterator[list[SymbolInfo]]:
+    """Parse many compound files, in parallel when there are enough of them.
+
+    Yields one list of SymbolInfo per refid, in the order of ``refids``.
+    ``skip_ids`` maps a compound refid to member ids not to parse from it.
+    Parses serially on a single CPU, for small inputs, or if the pool can't
+    start.
+    """
+    skip_ids = skip_ids or {}
+    skips = [skip_ids.get(refid, frozenset()) for refid in refids]
+    done = 0
+    workers = min(_usable_cpus(), len(refids) // _PARALLEL_MIN_COMPOUNDS)
+    if workers > 1:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(refids) // (4 * workers))
+                for syms in pool.map(_parse_one_compound,
+                                     [xml_dir] * len(refids), refids, skips,
+                                     [shallow] * len(refids),
+                                     chunksize=chunksize):
+                    yield syms
+                    done += 1
+            return
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            pass  # finish serially from where the pool stopped
+    for refid, skip in zip(refids[done:], skips[done:]):
+        yield _parse_one_compound(xml_dir, refid, skip, shallow)
+
+
+def _member_summary(memberdef: ET.Element) -> dict:
+    """Summarize a <memberdef> for the ``members`` subcommand.
+
+    Single pass over the children, like _parse_memberdef_element().
+    """
+    name_e = type_e = brief_e = loc = None
+    for child in memberdef:
+        tag = child.tag
+        if tag == "name":
+            if name_e is None:
+                name_e = child
+        elif tag == "type":
+            if type_e is None:
+                type_e = child
+        elif tag == "briefdescription":
+            if brief_e is None:
+                brief_e = child
+        elif tag == "location":
+            if loc is None:
+                loc = child
+
+    member = {
+        "name": _get_text(name_e),
+        "kind": memberdef.get("kind", ""),
+        "type": _get_text(type_e),
+        "brief": _get_text(brief_e),
+    }
+    if loc is not None:
+        member["line"] = int(loc.get("line", "0"))
+    return member
+
+
+def _walk_callgraph(lookup, name: str, depth: int, direction: str,
+                    max_nodes: int, exclude_kinds: Optional[set[str]],
+                    prefetch=None) -> dict:
+    """Build the nested call-graph dict shared by both index backends.
+
+    ``lookup(fname)`` returns ``(kind, file, line, references, referenced_by)``
+    or None for an unknown name.  ``prefetch(names)``, if given, is called
+    with a node's unvisited neighbours before they are expanded so a
+    backend can batch the lookups.
+    """
+    visited: set[str] = set()
+    node_count = [0]
+    # Normalized once: None when nothing is excluded, so the per-node test
+    # is a single identity check in the common --include-macros case.
+    excluded = frozenset(exclude_kinds) if exclude_kinds else None
+
+    def _enter(fname: str, d: int, dir_: str) -> tuple[dict, Optional[Iterator]]:
+        """Create the node for ``fname``; return it with its pending edges."""
+        node: dict = {"name": fname, "calls": [], "callers": []}
+        if d <= 0 or fname in visited:
+            return node, None
+        if max_nodes > 0 and node_count[0] >= max_nodes:
+            return node, None
+        visited.add(fname)
+        node_count[0] += 1
+
+        info = lookup(fname)
+        if info is None:
+            return node, None
+        kind, file, line, references, referenced_by = info
+        if excluded is not None and kind in excluded:
+            return node, None
+
+        node["kind"] = kind
+        node["file"] = file
+        node["line"] = line
+
+        edges: list[tuple[str, str]] = []
+        if dir_ in ("calls", "both"):
+            edges.extend(("calls", ref) for ref in references)
+        if dir_ in ("callers", "both"):
+            edges.extend(("callers", ref) for ref in referenced_by)
+        if prefetch is not None and d > 1:
+            prefetch(ref for _, ref in edges if ref not in visited)
+        return node, iter(edges)
+
+    # Depth-first with an explicit stack of (node, pending edges, depth)
+    # frames; children are expanded in the same order as a recursive
+    # walk, so visited/cycle marking is unchanged.
+    result, edges = _enter(name, depth, direction)
+    stack = [(result, edges, depth)] if edges is not None else []
+    while stack:
+        node, edges, d = stack[-1]
+        edge = next(edges, None)
+        if edge is None or (max_nodes > 0 and node_count[0] >= max_nodes):
+            stack.pop()
+            continue
+        key, ref = edge
+        if ref in visited:
+            node[key].append({"name": ref, "calls": [], "callers": [], "cycle": True})
+            continue
+        child, child_edges = _enter(ref, d - 1, direction)
+        node[key].append(child)
+        if child_edges is not None:
+            stack.append((child, child_edges, d - 1))
+
+    truncated = max_nodes > 0 and node_count[0] >= max_nodes
+    result["_meta"] = {
+        "total_nodes": node_count[0],
+        "max_nodes": max_nodes,
+        "truncated": truncated,
+    }
+    if truncated:
+        result["_meta"]["hint"] = (
+            f"Graph truncated at {max_nodes} nodes. "
+            f"Use --max-nodes {max_nodes * 2} to see more."
+        )
+    return result
+
+
+class _IndexEntry(NamedTuple):
+    """One index.xml entry for a name (a compound or one of its members)."""
+    refid: str
+    kind: str
+    compound_refid: str
+    is_compound: bool
 
 
 class DoxygenXMLIndex:
     """Parses Doxygen XML output and provides query methods."""
 
-    def __init__(self, xml_dir: Path):
+    def __init__(self, xml_dir: Path, cache_path: Optional[Path] = None):
         self.xml_dir = xml_dir
-        self._index: dict[str, list[dict]] = {}   # name -> [{refid, kind, compound_refid}]
-        self._compound_cache: dict[str, ET.Element] = {}
+        # Parsed-symbol cache that survives across CLI invocations
+        self.cache_path = cache_path or xml_dir.parent / "query_cache.json"
+        self._index: dict[str, tuple[_IndexEntry, ...]] = {}  # name -> entries
+        # member refid -> compound refids listing it, in index.xml order
+        self._member_compounds: dict[str, tuple[str, ...]] = {}
+        # refid -> (root, {memberdef id: memberdef element}), LRU-bounded
+        self._compound_cache: collections.OrderedDict[
+            str, tuple[ET.Element, dict[str, ET.Element]]] = collections.OrderedDict()
+        # (name, scope, detailed) -> find_symbol() results
+        self._symbol_cache: dict[tuple[str, str, bool], list[SymbolInfo]] = {}
         self._all_symbols: list[SymbolInfo] | None = None
+        self._lower_names: list[str] | None = None  # parallel to _all_symbols
+        # name/kind/file columns parallel to _all_symbols, for bulk scans
+        self._col_name: list[str] = []
+        self._col_kind: list[str] = []
+        self._col_file: list[str] = []
+        self._trigrams: _TrigramIndex | None = None   # over _lower_names
+        self._kinds: list[str] | None = None           # get_all_kinds() result
         self._parse_index()
 
     def _parse_index(self):
@@ -212,39 +785,41 @@ class DoxygenXMLIndex:
 
         tree = ET.parse(str(index_path))
         root = tree.getroot()
+        index: collections.defaultdict[str, list[_IndexEntry]] = collections.defaultdict(list)
+        member_compounds: collections.defaultdict[str, list[str]] = collections.defaultdict(list)
 
         for compound in root.findall("compound"):
             compound_refid = compound.get("refid", "")
-            compound_kind = compound.get("kind", "")
+            compound_kind = sys.intern(compound.get("kind", ""))
             compound_name = (compound.findtext("name") or "").strip()
 
             # Index the compound itself (file, class, struct, etc.)
             if compound_name:
-                entry = {
-                    "refid": compound_refid,
-                    "kind": compound_kind,
-                    "compound_refid": compound_refid,
-                    "is_compound": True,
-                }
-                self._index.setdefault(compound_name, []).append(entry)
+                index[compound_name].append(
+                    _IndexEntry(compound_refid, compound_kind, compound_refid, True))
 
             # Index members (functions, variables, etc.)
             for member in compound.findall("member"):
                 member_name = (member.findtext("name") or "").strip()
                 member_refid = member.get("refid", "")
-                member_kind = member.get("kind", "")
+                member_kind = sys.intern(member.get("kind", ""))
+                if member_refid:
+                    member_compounds[member_refid].append(compound_refid)
                 if member_name:
-                    entry = {
-                        "refid": member_refid,
-                        "kind": member_kind,
-                        "compound_refid": compound_refid,
-                        "is_compound": False,
-                    }
-                    self._index.setdefault(member_name, []).append(entry)
-
-    def _load_compound(self, refid: str) -> Optional[ET.Element]:
-        """Lazily load and cache a compound XML file."""
+                    index[member_name].append(
+                        _IndexEntry(member_refid, member_kind, compound_refid, False))
+
+        # Read-only from here on: freeze into tuples
+        self._index = {name: tuple(entries) for name, entries in index.items()}
+        self._member_compounds = {
+            refid: tuple(dict.fromkeys(refids)) for refid, refids in member_compounds.items()}
+
+    def _load_compound_entry(
+        self, refid: str,
+    ) -> Optional[tuple[ET.Element, dict[str, ET.Element]]]:
+        """Lazily load and cache a compound XML file with its memberdef map."""
         if refid in self._compound_cache:
+            self._compound_cache.move_to_end(refid)
             return self._compound_cache[refid]
 
         xml_file = self.xml_dir / f"{refid}.xml"
@@ -252,36 +827,107 @@ class DoxygenXMLIndex:
             return None
 
         tree = ET.parse(str(xml_file))
-        root = tree.getroot()
-        self._compound_cache[refid] = root
-        return root
+        return self._cache_compound(refid, tree.getroot())
+
+    def _cache_compound(
+        self, refid: str, root: ET.Element,
+    ) -> tuple[ET.Element, dict[str, ET.Element]]:
+        """Index a parsed compound's memberdefs and insert it into the LRU."""
+        members: dict[str, ET.Element] = {}
+        for memberdef in root.iter("memberdef"):
+            members.setdefault(memberdef.get("id", ""), memberdef)  # first wins
+        self._compound_cache[refid] = (root, members)
+        if len(self._compound_cache) > _COMPOUND_CACHE_SIZE:
+            self._compound_cache.popitem(last=False)
+        return root, members
+
+    def _prefetch_compounds(self, refids: Iterable[str]) -> None:
+        """Load several uncached compounds, overlapping file reads with parsing.
+
+        Files are read on a thread pool and parsed from bytes as they
+        arrive.  Unreadable or malformed files are skipped here and left to
+        _load_compound_entry() to report.
+        """
+        wanted = [r for r in dict.fromkeys(refids) if r not in self._compound_cache]
+        wanted = wanted[:_COMPOUND_CACHE_SIZE]
+        if len(wanted) < 2:
+            return
 
-    def _parse_memberdef(self, memberdef: ET.Element) -> SymbolInfo:
+        def _read(refid: str) -> Optional[bytes]:
+            try:
+                return (self.xml_dir / f"{refid}.xml").read_bytes()
+            except OSError:
+                return None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            for refid, data in zip(wanted, pool.map(_read, wanted)):
+                if data is None:
+                    continue
+                try:
+                    root = ET.fromstring(data)
+                except ET.ParseError:
+                    continue
+                self._cache_compound(refid, root)
+
+    def _load_compound(self, refid: str) -> Optional[ET.Element]:
+        """Lazily load and cache a compound XML file."""
+        loaded = self._load_compound_entry(refid)
+        return loaded[0] if loaded is not None else None
+
+    def _find_memberdef(self, compound_refid: str, refid: str) -> Optional[ET.Element]:
+        """Return the <memberdef> with the given id in a compound, in O(1)."""
+        loaded = self._load_compound_entry(compound_refid)
+        if loaded is None:
+            return None
+        return loaded[1].get(refid)
+
+    def _parse_memberdef(self, memberdef: ET.Element, detailed: bool = True) -> SymbolInfo:
         """Parse a <memberdef> element into a SymbolInfo."""
-        return _parse_memberdef_element(memberdef)
+        return _parse_memberdef_element(memberdef, detailed=detailed)
 
-    def find_symbol(self, name: str, scope: str = "") -> list[SymbolInfo]:
+    def find_symbol(self, name: str, scope: str = "",
+                    detailed: bool = True) -> list[SymbolInfo]:
         """Find all symbols matching the given name.
 
         Args:
             name: Symbol name to look up.
             scope: If non-empty, only return symbols whose file starts with this prefix.
+            detailed: If False, leave ``detailed`` empty instead of extracting
+                the detaileddescription text.
+
+        Results are memoized per (name, scope, detailed), so repeated lookups
+        during callgraph traversal don't re-parse the compound XML.
         """
-        entries = self._index.get(name, [])
+        cache_key = (name, scope, detailed)
+        cached = self._symbol_cache.get(cache_key)
+        if cached is None and not detailed:
+            cached = self._symbol_cache.get((name, scope, True))
+        if cached is not None:
+            return cached
+
+        entries = self._index.get(name, ())
         results = []
 
+        # Resolve each distinct compound once (a name can have several
+        # entries in one compound, e.g. overloads), but keep the entries'
+        # original order since callers take the first result.
+        compound_refids = list(dict.fromkeys(e.compound_refid for e in entries))
+        self._prefetch_compounds(compound_refids)
+        loaded = {cid: self._load_compound_entry(cid) for cid in compound_refids}
+
         for entry in entries:
-            if entry["is_compound"]:
-                root = self._load_compound(entry["compound_refid"])
-                if root is None:
-                    continue
+            compound = loaded[entry.compound_refid]
+            if compound is None:
+                continue
+            root, members = compound
+            if entry.is_compound:
                 compounddef = root.find(".//compounddef")
                 if compounddef is None:
                     continue
                 sym = SymbolInfo(
-                    id=entry["refid"],
+                    id=entry.refid,
                     name=name,
-                    kind=entry["kind"],
+                    kind=entry.kind,
                 )
                 location = compounddef.find("location")
                 if location is not None:
@@ -292,24 +938,26 @@ class DoxygenXMLIndex:
                     continue
                 results.append(sym)
             else:
-                root = self._load_compound(entry["compound_refid"])
-                if root is None:
+                memberdef = members.get(entry.refid)
+                if memberdef is None:
+                    continue
+                sym = self._parse_memberdef(memberdef, detailed)
+                if scope and not sym.file.startswith(scope):
                     continue
-                for memberdef in root.iter("memberdef"):
-                    if memberdef.get("id") == entry["refid"]:
-                        sym = self._parse_memberdef(memberdef)
-                        if scope and not sym.file.startswith(scope):
-                            break
-                        results.append(sym)
-                        break
+                results.append(sym)
 
+        self._symbol_cache[cache_key] = results
         return results
 
     def get_all_symbols(self, scope: str = "") -> list[SymbolInfo]:
         """Get all symbols from the index.
 
-        Uses streaming iterparse for memory efficiency on large codebases.
-        Results are cached (only the unscoped full set).
+        Compound files are stream-parsed with iterparse, in a process pool
+        when there are many of them.  Symbols are parsed shallowly (id, name,
+        kind, location only); use load_details() before emitting full
+        records.  Per-file results are persisted to ``cache_path`` and
+        reused while the file's mtime and size are unchanged; the unscoped
+        full set is also cached in memory.
 
         Args:
             scope: If non-empty, only return symbols whose file starts with this prefix.
@@ -325,53 +973,224 @@ class DoxygenXMLIndex:
 
         # Collect compound refids that have members
         compound_refids: set[str] = set()
+        listed_in: dict[str, set[str]] = {}  # member refid -> compounds listing it
         for entries in self._index.values():
             for entry in entries:
-                if not entry["is_compound"]:
-                    compound_refids.add(entry["compound_refid"])
-
-        # Stream-parse each compound file once
+                if not entry.is_compound:
+                    compound_refids.add(entry.compound_refid)
+                    listed_in.setdefault(entry.refid, set()).add(entry.compound_refid)
+
+        # Doxygen member ids are "<defining compound>_1<anchor>", and members
+        # listed under several compounds (groups, namespaces, headers) are
+        # duplicated into each one's XML.  Parse them only from the
+        # defining compound instead of parsing every copy and deduping.
+        file_stats: dict[str, os.stat_result] = {}
         for refid in compound_refids:
-            xml_path = self.xml_dir / f"{refid}.xml"
-            if not xml_path.exists():
+            try:
+                file_stats[refid] = (self.xml_dir / f"{refid}.xml").stat()
+            except OSError:
                 continue
-            for sym in _iterparse_compound(xml_path):
+        existing = set(file_stats)
+        skip_ids: dict[str, set[str]] = {}
+        for member_refid, compounds in listed_in.items():
+            owner = member_refid.rpartition("_1")[0]
+            if len(compounds) > 1 and owner in compounds and owner in existing:
+                for other in compounds - {owner}:
+                    skip_ids.setdefault(other, set()).add(member_refid)
+
+        # Reuse on-disk results for unchanged files; parse the rest once
+        # each, fanning out across processes.
+        disk_cache = self._load_parse_cache()
+        per_compound: dict[str, list[SymbolInfo]] = {}
+        fresh_cache: dict[str, tuple[tuple, list[SymbolInfo]]] = {}
+        to_parse: list[str] = []
+        for refid in sorted(existing):
+            st = file_stats[refid]
+            key = (st.st_mtime_ns, st.st_size, frozenset(skip_ids.get(refid, ())))
+            cached = disk_cache.get(refid)
+            if cached is not None and cached[0] == key:
+                per_compound[refid] = cached[1]
+                fresh_cache[refid] = cached
+            else:
+                to_parse.append(refid)
+                fresh_cache[refid] = (key, [])
+
+        parsed = _parse_compounds(
+            self.xml_dir, to_parse,
+            {r: fresh_cache[r][0][2] for r in to_parse},
+            shallow=True,
+        )
+        for refid, compound_syms in zip(to_parse, parsed):
+            per_compound[refid] = compound_syms
+            fresh_cache[refid] = (fresh_cache[refid][0], compound_syms)
+
+        if to_parse or len(fresh_cache) != len(disk_cache):
+            self._save_parse_cache(fresh_cache)
+
+        for refid in sorted(existing):
+            for sym in per_compound[refid]:
                 if sym.id and sym.id not in seen_ids:
                     seen_ids.add(sym.id)
                     symbols.append(sym)
 
         self._all_symbols = symbols
+        self._lower_names = [s.name.lower() for s in symbols]
+        self._col_name = [s.name for s in symbols]
+        self._col_kind = [s.kind for s in symbols]
+        self._col_file = [s.file for s in symbols]
         if scope:
             return [s for s in symbols if s.file.startswith(scope)]
         return symbols
 
-    def get_all_names(self) -> list[str]:
-        """Return all symbol names in the index."""
-        return list(self._index.keys())
+    def _load_parse_cache(self) -> dict[str, tuple[tuple, list[SymbolInfo]]]:
+        """Read the on-disk parse cache: refid -> ((mtime_ns, size, skip_ids), symbols).
+
+        The cache lives inside the analyzed tree, so it is plain JSON (never
+        pickle) and every row is type-checked; anything unexpected discards
+        the whole cache.
+        """
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or data.get("version") != _PARSE_CACHE_VERSION:
+                return {}
+            entries = {}
+            for refid, ((mtime_ns, size, skip), rows) in data["entries"].items():
+                if not (isinstance(refid, str) and type(mtime_ns) is int
+                        and type(size) is int and isinstance(skip, list)
+                        and all(isinstance(i, str) for i in skip)):
+                    return {}
+                symbols = []
+                for row in rows:
+                    if (not isinstance(row, list) or len(row) != len(_PARSE_CACHE_ROW_TYPES)
+                            or not all(type(v) is t for v, t in zip(row, _PARSE_CACHE_ROW_TYPES))):
+                        return {}
+                    sym = SymbolInfo(*row)
+                    sym.kind = sys.intern(sym.kind)
+                    sym.file = sys.intern(sym.file)
+                    symbols.append(sym)
+                entries[refid] = ((mtime_ns, size, frozenset(skip)), symbols)
+            return entries
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    def _save_parse_cache(self, entries: dict[str, tuple[tuple, list[SymbolInfo]]]) -> None:
+        """Atomically write the parse cache (temp file + rename); best effort."""
+        payload = {
+            "version": _PARSE_CACHE_VERSION,
+            "entries": {
+                refid: [[mtime_ns, size, sorted(skip)],
+                        [[getattr(s, k) for k in _SYMBOL_FIELDS] for s in symbols]]
+                for refid, ((mtime_ns, size, skip), symbols) in entries.items()
+            },
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".query_cache.", dir=str(self.cache_path.parent))
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def load_details(self, symbols: list[SymbolInfo]) -> list[SymbolInfo]:
+        """Return fully-parsed copies of shallow symbols from get_all_symbols().
+
+        Only the compounds containing ``symbols`` are parsed, so callers
+        should pass just the page of results they are about to print.
+        """
+        def _compounds_for(sym: SymbolInfo) -> list[str]:
+            # Keyed on the member id, not the name: a memberdef's <name> can
+            # differ from its index.xml entry.  Defining compound
+            # ("<compound>_1<anchor>") first, as in get_all_symbols.
+            owner = sym.id.rpartition("_1")[0]
+            return sorted(self._member_compounds.get(sym.id, ()), key=lambda r: r != owner)
+
+        candidates = [_compounds_for(sym) for sym in symbols]
+        self._prefetch_compounds(refids[0] for refids in candidates if refids)
+        detailed = []
+        for sym, refids in zip(symbols, candidates):
+            full = None
+            for compound_refid in refids:
+                memberdef = self._find_memberdef(compound_refid, sym.id)
+                if memberdef is not None:
+                    full = self._parse_memberdef(memberdef)
+                    break
+            if full is None:
+                print(f"Warning: no memberdef found for {sym.id}; "
+                      f"details for {sym.name} are incomplete.", file=sys.stderr)
+                full = sym
+            detailed.append(full)
+        return detailed
+
+    def search_substring(self, needle: str, scope: str = "") -> list[SymbolInfo]:
+        """Case-insensitive substring search over symbol names.
+
+        Args:
+            needle: Lowercased substring to look for.
+            scope: If non-empty, only return symbols whose file starts with this prefix.
+        """
+        symbols = self.get_all_symbols()
+        lower_names = self._lower_names
+        return [
+            symbols[i] for i in self._candidate_indices([needle])
+            if needle in lower_names[i]
+            and (not scope or symbols[i].file.startswith(scope))
+        ]
+
+    def search_regex(self, regex: re.Pattern, scope: str = "") -> list[SymbolInfo]:
+        """Regex search over symbol names, prefiltered by the trigram index."""
+        symbols = self.get_all_symbols()
+        candidates = self._candidate_indices(_regex_literals(regex))
+        if isinstance(candidates, range):
+            matches = _filter_by_name(symbols, regex, self._col_name)
+        else:
+            matches = _filter_by_name([symbols[i] for i in candidates], regex)
+        if scope:
+            matches = [s for s in matches if s.file.startswith(scope)]
+        return matches
+
+    def _candidate_indices(self, literals: list[str]) -> Iterable[int]:
+        """Positions in get_all_symbols() that may contain all ``literals``."""
+        symbols = self.get_all_symbols()
+        if self._trigrams is None:
+            self._trigrams = _TrigramIndex(self._lower_names)
+        candidates = self._trigrams.candidates(literals)
+        if candidates is None:
+            return range(len(symbols))
+        return sorted(candidates)
+
+    def get_all_names(self, min_len: int = 0, max_len: Optional[int] = None) -> list[str]:
+        """Return all symbol names in the index, optionally within a length range."""
+        if min_len <= 0 and max_len is None:
+            return list(self._index.keys())
+        return [n for n in self._index
+                if min_len <= len(n) and (max_len is None or len(n) <= max_len)]
 
     def get_all_kinds(self) -> list[str]:
-        """Return all distinct symbol kinds."""
-        kinds: set[str] = set()
-        for entries in self._index.values():
-            for entry in entries:
-                kinds.add(entry["kind"])
-        return sorted(kinds)
+        """Return all distinct symbol kinds (computed once per index)."""
+        if self._kinds is None:
+            self._kinds = sorted({entry.kind for entries in self._index.values()
+                                  for entry in entries})
+        return list(self._kinds)
 
     def get_stats(self) -> dict:
         """Return summary statistics about the index."""
         symbols = self.get_all_symbols()
-        by_kind: dict[str, int] = {}
-        by_file: dict[str, int] = {}
-        for s in symbols:
-            by_kind[s.kind] = by_kind.get(s.kind, 0) + 1
-            if s.file:
-                by_file[s.file] = by_file.get(s.file, 0) + 1
+        by_kind = collections.Counter(self._col_kind)
+        by_file = collections.Counter(filter(None, self._col_file))
         return {
             "total_symbols": len(symbols),
             "by_kind": dict(sorted(by_kind.items(), key=lambda x: -x[1])),
             "by_file": dict(sorted(by_file.items(), key=lambda x: -x[1])),
             "index_backend": "xml",
-            "xml_files": len(list(self.xml_dir.glob("*.xml"))),
+            "xml_files": _scan_xml_dir(self.xml_dir)[1],
         }
 
     def get_members(self, compound_name: str) -> Optional[dict]:
@@ -379,13 +1198,13 @@ class DoxygenXMLIndex:
 
         Returns dict with compound info and member list, or None if not found.
         """
-        entries = self._index.get(compound_name, [])
-        compound_entries = [e for e in entries if e["is_compound"]]
+        entries = self._index.get(compound_name, ())
+        compound_entries = [e for e in entries if e.is_compound]
         if not compound_entries:
             return None
 
         entry = compound_entries[0]
-        root = self._load_compound(entry["compound_refid"])
+        root = self._load_compound(entry.compound_refid)
         if root is None:
             return None
 
@@ -395,7 +1214,7 @@ class DoxygenXMLIndex:
 
         result = {
             "name": compound_name,
-            "kind": entry["kind"],
+            "kind": entry.kind,
             "file": "",
             "line": 0,
             "brief": _get_text(compounddef.find("briefdescription")),
@@ -407,36 +1226,56 @@ class DoxygenXMLIndex:
             result["file"] = location.get("file", "")
             result["line"] = int(location.get("line", "0"))
 
-        for memberdef in compounddef.iter("memberdef"):
-            member = {
-                "name": _get_text(memberdef.find("name")),
-                "kind": memberdef.get("kind", ""),
-                "type": _get_text(memberdef.find("type")),
-                "brief": _get_text(memberdef.find("briefdescription")),
-            }
-            loc = memberdef.find("location")
-            if loc is not None:
-                member["line"] = int(loc.get("line", "0"))
-            result["members"].append(member)
+        result["members"] = [_member_summary(m) for m in compounddef.iter("memberdef")]
 
         return result
 
     def get_all_files(self, scope: str = "") -> list[str]:
         """Return all distinct file paths from symbols."""
-        files: set[str] = set()
-        for s in self.get_all_symbols():
-            if s.file:
-                if scope and not s.file.startswith(scope):
-                    continue
-                files.add(s.file)
+        self.get_all_symbols()
+        files = set(self._col_file)
+        files.discard("")
+        if scope:
+            return sorted(f for f in files if f.startswith(scope))
         return sorted(files)
 
     def get_symbols_in_file(self, file_path: str) -> list[SymbolInfo]:
         """Return all symbols defined in a specific file, sorted by line."""
-        results = [s for s in self.get_all_symbols() if s.file == file_path]
+        symbols = self.get_all_symbols()
+        results = list(itertools.compress(
+            symbols, [f == file_path for f in self._col_file]))
         results.sort(key=lambda s: s.line)
         return results
 
+    def query_symbols(self, scope: str = "", kind: Optional[str] = None,
+                      file_substr: Optional[str] = None) -> list[SymbolInfo]:
+        """Return symbols filtered by file prefix, exact kind and file substring.
+
+        Always returns a new list, in get_all_symbols() order.
+        """
+        symbols = self.get_all_symbols()
+        keep = [
+            (not scope or f.startswith(scope))
+            and (not kind or k == kind)
+            and (not file_substr or file_substr in f)
+            for k, f in zip(self._col_kind, self._col_file)
+        ]
+        return list(itertools.compress(symbols, keep))
+
+    def count_symbols(self, scope: str = "", kind: Optional[str] = None,
+                      file_substr: Optional[str] = None) -> int:
+        """Number of symbols query_symbols() would return."""
+        return len(self.query_symbols(scope, kind, file_substr))
+
+    def page_symbols(self, scope: str = "", kind: Optional[str] = None,
+                     file_substr: Optional[str] = None,
+                     limit: int = 0, offset: int = 0) -> tuple[list[SymbolInfo], int]:
+        """One page of query_symbols() sorted by (file, line), plus the total."""
+        symbols = self.query_symbols(scope, kind, file_substr)
+        symbols.sort(key=lambda s: (s.file, s.line))
+        end = offset + limit if limit > 0 else None
+        return symbols[offset:end], len(symbols)
+
     def build_callgraph(self, name: str, depth: int = 2,
                         direction: str = "both",
                         max_nodes: int = 0,
@@ -453,63 +1292,51 @@ class DoxygenXMLIndex:
         Returns:
             Nested dict with _meta containing truncation info.
         """
-        visited = set()
-        node_count = [0]
-
-        def _traverse(fname: str, d: int, dir_: str) -> dict:
-            node = {"name": fname, "calls": [], "callers": []}
-            if d <= 0 or fname in visited:
-                return node
-            if max_nodes > 0 and node_count[0] >= max_nodes:
-                return node
-            visited.add(fname)
-            node_count[0] += 1
-
-            syms = self.find_symbol(fname)
+        def _lookup(fname: str) -> Optional[tuple]:
+            syms = self.find_symbol(fname, detailed=False)
             if not syms:
-                return node
-
+                return None
             sym = syms[0]
-            if exclude_kinds and sym.kind in exclude_kinds:
-                return node
-
-            node["kind"] = sym.kind
-            node["file"] = sym.file
-            node["line"] = sym.line
-
-            if dir_ in ("calls", "both"):
-                for ref in sym.references:
-                    if max_nodes > 0 and node_count[0] >= max_nodes:
-                        break
-                    if ref not in visited:
-                        node["calls"].append(_traverse(ref, d - 1, dir_))
-                    else:
-                        node["calls"].append({"name": ref, "calls": [], "callers": [], "cycle": True})
-
-            if dir_ in ("callers", "both"):
-                for ref in sym.referenced_by:
-                    if max_nodes > 0 and node_count[0] >= max_nodes:
-                        break
-                    if ref not in visited:
-                        node["callers"].append(_traverse(ref, d - 1, dir_))
-                    else:
-                        node["callers"].append({"name": ref, "calls": [], "callers": [], "cycle": True})
-
-            return node
-
-        result = _traverse(name, depth, direction)
-        truncated = max_nodes > 0 and node_count[0] >= max_nodes
-        result["_meta"] = {
-            "total_nodes": node_count[0],
-            "max_nodes": max_nodes,
-            "truncated": truncated,
-        }
-        if truncated:
-            result["_meta"]["hint"] = (
-                f"Graph truncated at {max_nodes} nodes. "
-                f"Use --max-nodes {max_nodes * 2} to see more."
-            )
-        return result
+            return sym.kind, sym.file, sym.line, sym.references, sym.referenced_by
+
+        return _walk_callgraph(_lookup, name, depth, direction, max_nodes, exclude_kinds)
+
+
+# Stay below SQLITE_MAX_VARIABLE_NUMBER (999 on older SQLite builds).
+_SQLITE_MAX_PARAMS = 900
+
+# Max entries in DoxygenSQLiteIndex's find_symbol()/get_members() memos.
+_LOOKUP_CACHE_SIZE = 1024
+
+# Bump when the SQLite schema changes; older databases are rebuilt.
+_DB_SCHEMA_VERSION = 5
+
+# brief/detailed texts at least this long are stored compressed (as a BLOB).
+_COMPRESS_MIN_CHARS = 256
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_TEXT_CODEC = "zstd" if _zstd is not None else "zlib"
+_zstd_compressor = _zstd.ZstdCompressor(level=3) if _zstd is not None else None
+
+
+def _pack_text(text: str):
+    """Compress a long description for storage; short texts stay TEXT."""
+    if len(text) < _COMPRESS_MIN_CHARS:
+        return text
+    data = text.encode("utf-8")
+    if _zstd_compressor is not None:
+        packed = _zstd_compressor.compress(data)
+    else:
+        packed = zlib.compress(data)
+    return packed if len(packed) < len(data) else text
+
+
+def _unpack_text(value) -> str:
+    """Inverse of _pack_text() for a column value read back from SQLite."""
+    if not isinstance(value, bytes):
+        return value or ""
+    if value.startswith(_ZSTD_MAGIC):
+        return _zstd.ZstdDecompressor().decompress(value).decode("utf-8")
+    return zlib.decompress(value).decode("utf-8")
 
 
 class DoxygenSQLiteIndex:
@@ -525,22 +1352,46 @@ class DoxygenSQLiteIndex:
         self.xml_dir = xml_dir
         self.db_path = db_path or xml_dir.parent / "symbols.db"
         self._conn: Optional[sqlite3.Connection] = None
+        self._all_symbols_cache: list[SymbolInfo] | None = None
+        self._has_fts: Optional[bool] = None
+        # name -> (kind, file, line, calls, callers), or None if unknown
+        self._graph_nodes: dict[str, Optional[tuple]] = {}
+        self._xml_count: Optional[int] = None  # set by _is_stale()'s directory scan
+        self._kinds: Optional[list[str]] = None  # get_all_kinds() result
+        # Bounded memos for find_symbol() / get_members(), cleared on rebuild
+        self._find_cache: dict[tuple[str, str], list[SymbolInfo]] = {}
+        self._members_cache: dict[str, Optional[dict]] = {}
         self._ensure_db()
 
     # -- lifecycle ----------------------------------------------------------
 
     def _connect(self) -> sqlite3.Connection:
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
+            # sqlite3 reuses prepared statements keyed by SQL text; the IN (...)
+            # queries vary by chunk length, so allow more than the default 128.
+            self._conn = sqlite3.connect(str(self.db_path), cached_statements=256)
             self._conn.execute("PRAGMA journal_mode=WAL")
             self._conn.execute("PRAGMA synchronous=NORMAL")
+            # Read-heavy workload: map the DB file and keep a large page cache
+            self._conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+            self._conn.execute("PRAGMA cache_size=-65536")    # 64 MiB
+            self._conn.execute("PRAGMA temp_store=MEMORY")
             self._conn.row_factory = sqlite3.Row
+            self._conn.create_function("REGEXP", 2, _sqlite_regexp, deterministic=True)
+            self._conn.create_function("PY_LOWER", 1, _sqlite_py_lower, deterministic=True)
         return self._conn
 
     def _ensure_db(self) -> None:
         """Create or refresh the database if needed."""
-        if self.db_path.exists() and not self._is_stale():
+        if (self.db_path.exists() and not self._is_stale()
+                and self._meta_current()):
             return
+        self._all_symbols_cache = None
+        self._has_fts = None
+        self._kinds = None
+        self._graph_nodes.clear()
+        self._find_cache.clear()
+        self._members_cache.clear()
         self._build_db()
 
     def _is_stale(self) -> bool:
@@ -549,20 +1400,29 @@ class DoxygenSQLiteIndex:
             db_mtime = self.db_path.stat().st_mtime
         except OSError:
             return True
-        for xml_file in self.xml_dir.glob("*.xml"):
-            try:
-                if xml_file.stat().st_mtime > db_mtime:
-                    return True
-            except OSError:
-                continue
-        return False
+        newest, self._xml_count = _scan_xml_dir(self.xml_dir)
+        return newest > db_mtime
+
+    def _meta_current(self) -> bool:
+        """False if the DB has an older schema or zstd blobs we can't read."""
+        try:
+            meta = dict(self._connect().execute(
+                "SELECT key, value FROM meta WHERE key IN ('schema_version', 'text_codec')"
+            ).fetchall())
+        except sqlite3.DatabaseError:
+            return False
+        if meta.get("schema_version") != str(_DB_SCHEMA_VERSION):
+            return False
+        return meta.get("text_codec") != "zstd" or _zstd is not None
 
     def _build_db(self) -> None:
         """Parse all XML files and populate the SQLite database."""
         conn = self._connect()
         conn.executescript("""
+            DROP TABLE IF EXISTS symbols_fts;
             DROP TABLE IF EXISTS symbols;
             DROP TABLE IF EXISTS refs;
+            DROP TABLE IF EXISTS members;
             DROP TABLE IF EXISTS meta;
 
             CREATE TABLE symbols (
@@ -586,16 +1446,32 @@ class DoxygenSQLiteIndex:
                 direction TEXT NOT NULL  -- 'calls' or 'callers'
             );
 
+            -- Per-compound member summaries for the members command; a
+            -- member listed in several compounds (e.g. groups) has a row in each.
+            CREATE TABLE members (
+                compound_id TEXT NOT NULL,
+                name        TEXT,
+                kind        TEXT,
+                type        TEXT,
+                brief       TEXT,
+                line        INTEGER
+            );
+
             CREATE TABLE meta (
                 key   TEXT PRIMARY KEY,
                 value TEXT
             );
 
             CREATE INDEX idx_symbols_name ON symbols(name);
-            CREATE INDEX idx_symbols_kind ON symbols(kind);
-            CREATE INDEX idx_symbols_file ON symbols(file);
-            CREATE INDEX idx_refs_from    ON refs(from_id);
+            -- (kind, is_compound) covers the stats GROUP BY kind; (file, line)
+            -- serves get_symbols_in_file's ORDER BY line without a sort.
+            CREATE INDEX idx_symbols_kind ON symbols(kind, is_compound);
+            CREATE INDEX idx_symbols_file ON symbols(file, line);
+            -- Covering index: refs lookups by symbol are index-only scans.
+            -- Queries ORDER BY rowid to keep Doxygen's reference order.
+            CREATE INDEX idx_refs_from    ON refs(from_id, direction, to_name);
             CREATE INDEX idx_refs_to      ON refs(to_name);
+            CREATE INDEX idx_members_compound ON members(compound_id);
         """)
 
         # Parse index.xml for compounds
@@ -606,48 +1482,60 @@ class DoxygenSQLiteIndex:
         tree = ET.parse(str(index_path))
         root = tree.getroot()
 
-        # Insert compound-level symbols and collect refids
+        # Rows are accumulated and bulk-inserted with executemany() in a
+        # single transaction below, instead of one execute() per row.
+        compound_rows: list[tuple] = []
+        sym_rows: list[tuple] = []
+        ref_rows: list[tuple] = []
+        member_rows: list[tuple] = []
+        loc_rows: list[tuple] = []
+
+        # Collect compound-level symbols and refids
         compound_refids: set[str] = set()
         compound_kinds: dict[str, str] = {}  # refid -> kind
+        listed_in: dict[str, set[str]] = {}  # member refid -> compounds listing it
         for compound in root.findall("compound"):
             crefid = compound.get("refid", "")
             ckind = compound.get("kind", "")
             cname = (compound.findtext("name") or "").strip()
             if cname:
-                conn.execute(
-                    "INSERT OR IGNORE INTO symbols (id, name, kind, is_compound) VALUES (?,?,?,1)",
-                    (crefid, cname, ckind),
-                )
+                compound_rows.append((crefid, cname, ckind))
             compound_kinds[crefid] = ckind
-            # Check if this compound has members
-            if compound.findall("member"):
+            for member in compound.iter("member"):
                 compound_refids.add(crefid)
+                listed_in.setdefault(member.get("refid", ""), set()).add(crefid)
+
+        # A member duplicated into several compounds' XML (groups, headers)
+        # gets its symbols/refs rows from the defining compound only, as in
+        # DoxygenXMLIndex.get_all_symbols(); every copy still goes into members.
+        skip_ids: dict[str, set[str]] = {}
+        for member_refid, compounds in listed_in.items():
+            owner = member_refid.rpartition("_1")[0]
+            if (len(compounds) > 1 and owner in compounds
+                    and (self.xml_dir / f"{owner}.xml").exists()):
+                for other in compounds - {owner}:
+                    skip_ids.setdefault(other, set()).add(member_refid)
+        seen_ids: set[str] = set()
 
-        # Stream-parse each compound XML for member symbols
-        for refid in compound_refids:
-            xml_path = self.xml_dir / f"{refid}.xml"
-            if not xml_path.exists():
-                continue
-            for sym in _iterparse_compound(xml_path):
-                conn.execute(
-                    """INSERT OR IGNORE INTO symbols
-                       (id, name, kind, file, line, body_start, body_end,
-                        return_type, params, brief, detailed, is_compound)
-                       VALUES (?,?,?,?,?,?,?,?,?,?,?,0)""",
+        # Parse compound XMLs for member symbols (across processes when large)
+        refids = sorted(compound_refids)
+        for refid, syms in zip(refids, _parse_compounds(self.xml_dir, refids)):
+            skip = skip_ids.get(refid, ())
+            for sym in syms:
+                member_rows.append(
+                    (refid, sym.name, sym.kind, sym.return_type, _pack_text(sym.brief),
+                     sym.line if sym.file or sym.line else None)
+                )
+                if sym.id in skip or sym.id in seen_ids:
+                    continue
+                seen_ids.add(sym.id)
+                sym_rows.append(
                     (sym.id, sym.name, sym.kind, sym.file, sym.line,
                      sym.body_start, sym.body_end, sym.return_type,
-                     sym.params, sym.brief, sym.detailed),
+                     sym.params, _pack_text(sym.brief), _pack_text(sym.detailed))
                 )
-                for ref_name in sym.references:
-                    conn.execute(
-                        "INSERT INTO refs (from_id, to_name, direction) VALUES (?,?,?)",
-                        (sym.id, ref_name, "calls"),
-                    )
-                for ref_name in sym.referenced_by:
-                    conn.execute(
-                        "INSERT INTO refs (from_id, to_name, direction) VALUES (?,?,?)",
-                        (sym.id, ref_name, "callers"),
-                    )
+                ref_rows.extend((sym.id, ref_name, "calls") for ref_name in sym.references)
+                ref_rows.extend((sym.id, ref_name, "callers") for ref_name in sym.referenced_by)
 
         # Item 12: Populate compound locations (struct/class/union/namespace)
         compound_loc_kinds = {"struct", "class", "union", "namespace"}
@@ -666,99 +1554,242 @@ class DoxygenSQLiteIndex:
                         cfile = loc.get("file", "")
                         cline = int(loc.get("line", "0"))
                         if cfile:
-                            conn.execute(
-                                "UPDATE symbols SET file=?, line=? WHERE id=?",
-                                (cfile, cline, crefid),
-                            )
+                            loc_rows.append((cfile, cline, crefid))
             except ET.ParseError:
                 continue
 
         import time as _time
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT OR IGNORE INTO symbols (id, name, kind, is_compound) VALUES (?,?,?,1)",
+            compound_rows,
+        )
+        conn.executemany(
+            """INSERT OR IGNORE INTO symbols
+               (id, name, kind, file, line, body_start, body_end,
+                return_type, params, brief, detailed, is_compound)
+               VALUES (?,?,?,?,?,?,?,?,?,?,?,0)""",
+            sym_rows,
+        )
+        conn.executemany(
+            "INSERT INTO refs (from_id, to_name, direction) VALUES (?,?,?)",
+            ref_rows,
+        )
+        conn.executemany(
+            "INSERT INTO members (compound_id, name, kind, type, brief, line) "
+            "VALUES (?,?,?,?,?,?)",
+            member_rows,
+        )
+        conn.executemany("UPDATE symbols SET file=?, line=? WHERE id=?", loc_rows)
+        try:
+            # Trigram index over names so substring search avoids a full scan
+            conn.execute(
+                "CREATE VIRTUAL TABLE symbols_fts USING fts5("
+                "name, content='symbols', content_rowid='rowid', tokenize='trigram')"
+            )
+            conn.execute("INSERT INTO symbols_fts(symbols_fts) VALUES('rebuild')")
+        except sqlite3.OperationalError:
+            pass  # SQLite built without FTS5 / trigram tokenizer (< 3.34)
         conn.execute(
             "INSERT OR REPLACE INTO meta (key, value) VALUES ('built_at', ?)",
             (str(_time.time()),),
         )
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("text_codec", _TEXT_CODEC), ("schema_version", str(_DB_SCHEMA_VERSION))],
+        )
         conn.commit()
 
     # -- public API (mirrors DoxygenXMLIndex) --------------------------------
 
-    def _row_to_symbol(self, row: sqlite3.Row) -> SymbolInfo:
+    def _row_to_symbol(
+        self,
+        row: sqlite3.Row,
+        refs: Optional[tuple[list[str], list[str]]] = None,
+    ) -> SymbolInfo:
+        """Build a SymbolInfo from a ``SELECT *`` row of ``symbols``.
+
+        Columns are read by position (table order) rather than by name;
+        ``sqlite3.Row`` name lookups dominate when converting many rows.
+        ``refs`` is a pre-fetched ``(calls, callers)`` pair from
+        :meth:`_load_refs_map`; when omitted the refs are queried directly.
+        """
+        (sid, name, kind, file, line, body_start, body_end,
+         return_type, params, brief, detailed) = row[:11]
         sym = SymbolInfo(
-            id=row["id"],
-            name=row["name"],
-            kind=row["kind"],
-            file=row["file"] or "",
-            line=row["line"] or 0,
-            body_start=row["body_start"] or 0,
-            body_end=row["body_end"] or 0,
-            return_type=row["return_type"] or "",
-            params=row["params"] or "",
-            brief=row["brief"] or "",
-            detailed=row["detailed"] or "",
+            sid, name, sys.intern(kind), sys.intern(file or ""),
+            line or 0, body_start or 0, body_end or 0,
+            return_type or "", params or "",
+            _unpack_text(brief), _unpack_text(detailed),
         )
+        if refs is not None:
+            sym.references.extend(refs[0])
+            sym.referenced_by.extend(refs[1])
+            return sym
         conn = self._connect()
         for r in conn.execute(
-            "SELECT to_name FROM refs WHERE from_id=? AND direction='calls'",
+            "SELECT to_name FROM refs WHERE from_id=? AND direction='calls' ORDER BY rowid",
             (sym.id,),
         ):
             sym.references.append(r["to_name"])
         for r in conn.execute(
-            "SELECT to_name FROM refs WHERE from_id=? AND direction='callers'",
+            "SELECT to_name FROM refs WHERE from_id=? AND direction='callers' ORDER BY rowid",
             (sym.id,),
         ):
             sym.referenced_by.append(r["to_name"])
         return sym
 
+    def _load_refs_map(self, ids: list[str]) -> dict[str, tuple[list[str], list[str]]]:
+        """Fetch refs for many symbols at once: id -> (calls, callers)."""
+        conn = self._connect()
+        refs: dict[str, tuple[list[str], list[str]]] = {i: ([], []) for i in ids}
+        for start in range(0, len(ids), _SQLITE_MAX_PARAMS):
+            chunk = ids[start:start + _SQLITE_MAX_PARAMS]
+            marks = ",".join("?" * len(chunk))
+            for from_id, to_name, direction in conn.execute(
+                f"SELECT from_id, to_name, direction FROM refs WHERE from_id IN ({marks}) "
+                "ORDER BY rowid",
+                chunk,
+            ):
+                if direction == "calls":
+                    refs[from_id][0].append(to_name)
+                elif direction == "callers":
+                    refs[from_id][1].append(to_name)
+        return refs
+
+    def _rows_to_symbols(self, rows: list[sqlite3.Row]) -> list[SymbolInfo]:
+        """Convert many rows, loading their refs in bulk instead of per row."""
+        refs = self._load_refs_map(list({r[0] for r in rows}))
+        return [self._row_to_symbol(r, refs[r[0]]) for r in rows]
+
+    def _remember(self, cache: dict, key, value):
+        """Store ``value`` in a bounded memo, evicting the oldest entry (FIFO)."""
+        cache[key] = value
+        if len(cache) > _LOOKUP_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        return value
+
     def find_symbol(self, name: str, scope: str = "") -> list[SymbolInfo]:
+        """Find all symbols named ``name``; results (and misses) are memoized."""
+        cached = self._find_cache.get((name, scope))
+        if cached is not None:
+            return cached
         conn = self._connect()
         if scope:
+            cond, params = _prefix_range("file", scope)
             rows = conn.execute(
-                "SELECT * FROM symbols WHERE name=? AND (file LIKE ? OR file IS NULL)",
-                (name, scope + "%"),
+                f"SELECT * FROM symbols WHERE name=? AND ({cond} OR file IS NULL) "
+                "ORDER BY rowid",
+                [name, *params],
             ).fetchall()
         else:
             rows = conn.execute(
                 "SELECT * FROM symbols WHERE name=?", (name,)
             ).fetchall()
-        return [self._row_to_symbol(r) for r in rows]
+        return self._remember(self._find_cache, (name, scope),
+                              [self._row_to_symbol(r) for r in rows])
 
     def get_all_symbols(self, scope: str = "") -> list[SymbolInfo]:
+        """Return all non-compound symbols; the unscoped result is cached."""
+        if self._all_symbols_cache is not None:
+            syms = self._all_symbols_cache
+            if scope:
+                return [s for s in syms if s.file.startswith(scope)]
+            return syms
         conn = self._connect()
         if scope:
+            cond, params = _prefix_range("file", scope)
             rows = conn.execute(
-                "SELECT * FROM symbols WHERE is_compound=0 AND file LIKE ?",
-                (scope + "%",),
+                f"SELECT * FROM symbols WHERE is_compound=0 AND {cond} ORDER BY rowid",
+                params,
             ).fetchall()
+            return self._rows_to_symbols(rows)
+        rows = conn.execute(
+            "SELECT * FROM symbols WHERE is_compound=0"
+        ).fetchall()
+        self._all_symbols_cache = self._rows_to_symbols(rows)
+        return self._all_symbols_cache
+
+    def load_details(self, symbols: list[SymbolInfo]) -> list[SymbolInfo]:
+        """Return ``symbols`` unchanged; rows are always fully populated."""
+        return symbols
+
+    def _fts_available(self) -> bool:
+        if self._has_fts is None:
+            self._has_fts = self._connect().execute(
+                "SELECT 1 FROM sqlite_master WHERE name='symbols_fts'"
+            ).fetchone() is not None
+        return self._has_fts
+
+    def search_substring(self, needle: str, scope: str = "") -> list[SymbolInfo]:
+        """Case-insensitive substring search over symbol names.
+
+        ASCII needles use SQL LIKE, narrowed through the trigram FTS5 index
+        when the database has one and the needle has three or more
+        characters.  LIKE only folds ASCII case, so other needles compare
+        against PY_LOWER(name), like DoxygenXMLIndex's str.lower() match.
+        """
+        conn = self._connect()
+        if needle.isascii():
+            sql = "SELECT * FROM symbols WHERE is_compound=0 AND name LIKE ? ESCAPE '\\'"
+            params: list = [f"%{_like_escape(needle)}%"]
+            if len(needle) >= 3 and self._fts_available():
+                sql += " AND rowid IN (SELECT rowid FROM symbols_fts WHERE symbols_fts MATCH ?)"
+                params.append('"' + needle.replace('"', '""') + '"')
         else:
-            rows = conn.execute(
-                "SELECT * FROM symbols WHERE is_compound=0"
-            ).fetchall()
-        return [self._row_to_symbol(r) for r in rows]
+            sql = "SELECT * FROM symbols WHERE is_compound=0 AND instr(PY_LOWER(name), ?) > 0"
+            params = [needle.lower()]
+        if scope:
+            cond, scope_params = _prefix_range("file", scope)
+            sql += f" AND {cond} ORDER BY rowid"
+            params.extend(scope_params)
+        return self._rows_to_symbols(conn.execute(sql, params).fetchall())
+
+    def search_regex(self, regex: re.Pattern, scope: str = "") -> list[SymbolInfo]:
+        """Regex search over symbol names via the REGEXP hook.
+
+        Matching is case-insensitive regardless of ``regex.flags``.
+        """
+        conn = self._connect()
+        sql = "SELECT * FROM symbols WHERE is_compound=0 AND name REGEXP ?"
+        params: list = [regex.pattern]
+        if scope:
+            cond, scope_params = _prefix_range("file", scope)
+            sql += f" AND {cond} ORDER BY rowid"
+            params.extend(scope_params)
+        return self._rows_to_symbols(conn.execute(sql, params).fetchall())
 
-    def get_all_names(self) -> list[str]:
-        """Return all distinct symbol names."""
+    def get_all_names(self, min_len: int = 0, max_len: Optional[int] = None) -> list[str]:
+        """Return all distinct symbol names, optionally within a length range."""
         conn = self._connect()
-        rows = conn.execute("SELECT DISTINCT name FROM symbols").fetchall()
+        if min_len <= 0 and max_len is None:
+            rows = conn.execute("SELECT DISTINCT name FROM symbols").fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT DISTINCT name FROM symbols WHERE length(name) BETWEEN ? AND ? "
+                "ORDER BY name",
+                (min_len, max_len if max_len is not None else sys.maxsize),
+            ).fetchall()
         return [r["name"] for r in rows]
 
     def get_all_kinds(self) -> list[str]:
-        """Return all distinct symbol kinds."""
-        conn = self._connect()
-        rows = conn.execute("SELECT DISTINCT kind FROM symbols").fetchall()
-        return sorted(r["kind"] for r in rows)
+        """Return all distinct symbol kinds (queried once per index)."""
+        if self._kinds is None:
+            conn = self._connect()
+            rows = conn.execute("SELECT DISTINCT kind FROM symbols").fetchall()
+            self._kinds = sorted(r["kind"] for r in rows)
+        return list(self._kinds)
 
     def get_stats(self) -> dict:
         """Return summary statistics about the index."""
         conn = self._connect()
-        total = conn.execute(
-            "SELECT COUNT(*) as c FROM symbols WHERE is_compound=0"
-        ).fetchone()["c"]
         by_kind = {}
         for r in conn.execute(
             "SELECT kind, COUNT(*) as c FROM symbols WHERE is_compound=0 "
             "GROUP BY kind ORDER BY c DESC"
         ):
             by_kind[r["kind"]] = r["c"]
+        total = sum(by_kind.values())  # kind is NOT NULL, so no extra COUNT(*) scan
         by_file = {}
         for r in conn.execute(
             "SELECT file, COUNT(*) as c FROM symbols WHERE is_compound=0 "
@@ -778,43 +1809,58 @@ class DoxygenSQLiteIndex:
             "by_file": by_file,
             "index_backend": "sqlite",
             "db_size_bytes": db_size,
-            "xml_files": len(list(self.xml_dir.glob("*.xml"))),
+            "xml_files": (self._xml_count if self._xml_count is not None
+                          else _scan_xml_dir(self.xml_dir)[1]),
         }
 
     def get_members(self, compound_name: str) -> Optional[dict]:
-        """Get members of a compound (struct/class/union)."""
+        """Get members of a compound (struct/class/union); memoized."""
+        if compound_name in self._members_cache:
+            return self._members_cache[compound_name]
         conn = self._connect()
         row = conn.execute(
             "SELECT * FROM symbols WHERE name=? AND is_compound=1",
             (compound_name,),
         ).fetchone()
         if row is None:
-            return None
+            return self._remember(self._members_cache, compound_name, None)
 
         result = {
             "name": compound_name,
             "kind": row["kind"],
             "file": row["file"] or "",
             "line": row["line"] or 0,
-            "brief": row["brief"] or "",
+            "brief": _unpack_text(row["brief"]),
             "members": [],
         }
 
-        # Parse compound XML for member details
-        members = _parse_compound_members(self.xml_dir, row["id"])
-        if members is not None:
-            result["members"] = members
+        # Member summaries were captured from the compound XML at build time
+        for m in conn.execute(
+            "SELECT name, kind, type, brief, line FROM members "
+            "WHERE compound_id=? ORDER BY rowid",
+            (row["id"],),
+        ):
+            member = {
+                "name": m["name"],
+                "kind": m["kind"],
+                "type": m["type"],
+                "brief": _unpack_text(m["brief"]),
+            }
+            if m["line"] is not None:
+                member["line"] = m["line"]
+            result["members"].append(member)
 
-        return result
+        return self._remember(self._members_cache, compound_name, result)
 
     def get_all_files(self, scope: str = "") -> list[str]:
-        """Return all distinct file paths."""
+        """Return all distinct file paths (those starting with ``scope``, if given)."""
         conn = self._connect()
         if scope:
+            cond, params = _prefix_range("file", scope)
             rows = conn.execute(
-                "SELECT DISTINCT file FROM symbols WHERE file != '' "
-                "AND file LIKE ? ORDER BY file",
-                (scope + "%",),
+                f"SELECT DISTINCT file FROM symbols WHERE file != '' AND {cond} "
+                "ORDER BY file",
+                params,
             ).fetchall()
         else:
             rows = conn.execute(
@@ -829,69 +1875,113 @@ class DoxygenSQLiteIndex:
             "SELECT * FROM symbols WHERE file=? AND is_compound=0 ORDER BY line",
             (file_path,),
         ).fetchall()
-        return [self._row_to_symbol(r) for r in rows]
+        return self._rows_to_symbols(rows)
+
+    @staticmethod
+    def _symbol_filter(scope: str, kind: Optional[str],
+                       file_substr: Optional[str]) -> tuple[str, list]:
+        """WHERE clause and params shared by query_symbols()/count_symbols()."""
+        where = ["is_compound=0"]
+        params: list = []
+        if scope:
+            cond, scope_params = _prefix_range("file", scope)
+            where.append(cond)
+            params.extend(scope_params)
+        if kind:
+            where.append("kind=?")
+            params.append(kind)
+        if file_substr:
+            where.append("instr(file, ?) > 0")
+            params.append(file_substr)
+        return " AND ".join(where), params
+
+    def query_symbols(self, scope: str = "", kind: Optional[str] = None,
+                      file_substr: Optional[str] = None) -> list[SymbolInfo]:
+        """Return symbols filtered by file prefix, exact kind and file substring."""
+        where, params = self._symbol_filter(scope, kind, file_substr)
+        rows = self._connect().execute(
+            f"SELECT * FROM symbols WHERE {where} ORDER BY rowid", params
+        ).fetchall()
+        return self._rows_to_symbols(rows)
+
+    def count_symbols(self, scope: str = "", kind: Optional[str] = None,
+                      file_substr: Optional[str] = None) -> int:
+        """Number of symbols query_symbols() would return, counted in SQL."""
+        where, params = self._symbol_filter(scope, kind, file_substr)
+        return self._connect().execute(
+            f"SELECT COUNT(*) FROM symbols WHERE {where}", params
+        ).fetchone()[0]
+
+    def page_symbols(self, scope: str = "", kind: Optional[str] = None,
+                     file_substr: Optional[str] = None,
+                     limit: int = 0, offset: int = 0) -> tuple[list[SymbolInfo], int]:
+        """One page of query_symbols() sorted by (file, line), plus the total.
+
+        Only the requested rows are read, via LIMIT/OFFSET; rowid breaks ties
+        the same way a stable sort of query_symbols() would.
+        """
+        where, params = self._symbol_filter(scope, kind, file_substr)
+        rows = self._connect().execute(
+            f"SELECT * FROM symbols WHERE {where} "
+            "ORDER BY file, line, rowid LIMIT ? OFFSET ?",
+            [*params, limit if limit > 0 else -1, offset],
+        ).fetchall()
+        return self._rows_to_symbols(rows), self.count_symbols(scope, kind, file_substr)
+
+    def _graph_node(self, fname: str) -> Optional[tuple]:
+        """Return ``(kind, file, line, calls, callers)`` for a call-graph node.
+
+        Memoized per index, so nodes shared by several graphs (or by the
+        calls and callers walks of one CLI run) are looked up once.
+        """
+        if fname not in self._graph_nodes:
+            self._prefetch_graph_nodes((fname,))
+        return self._graph_nodes[fname]
+
+    def _prefetch_graph_nodes(self, names: Iterable[str]) -> None:
+        """Load uncached call-graph nodes with one symbols and one refs query.
+
+        Like find_symbol()[0], the first row (lowest rowid) for a name wins.
+        """
+        todo = [n for n in dict.fromkeys(names) if n not in self._graph_nodes]
+        if not todo:
+            return
+        conn = self._connect()
+        rows: dict[str, sqlite3.Row] = {}
+        for start in range(0, len(todo), _SQLITE_MAX_PARAMS):
+            chunk = todo[start:start + _SQLITE_MAX_PARAMS]
+            marks = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT name, id, kind, file, line, MIN(rowid) FROM symbols "
+                f"WHERE name IN ({marks}) GROUP BY name",
+                chunk,
+            ):
+                rows[row["name"]] = row
+        refs = self._load_refs_map([row["id"] for row in rows.values()])
+        for fname in todo:
+            row = rows.get(fname)
+            if row is None:
+                self._graph_nodes[fname] = None
+                continue
+            calls, callers = refs[row["id"]]
+            self._graph_nodes[fname] = (
+                row["kind"], row["file"] or "", row["line"] or 0,
+                tuple(calls), tuple(callers),
+            )
 
     def build_callgraph(self, name: str, depth: int = 2,
                         direction: str = "both",
                         max_nodes: int = 0,
                         exclude_kinds: set[str] | None = None) -> dict:
-        visited: set[str] = set()
-        node_count = [0]
-
-        def _traverse(fname: str, d: int, dir_: str) -> dict:
-            node: dict = {"name": fname, "calls": [], "callers": []}
-            if d <= 0 or fname in visited:
-                return node
-            if max_nodes > 0 and node_count[0] >= max_nodes:
-                return node
-            visited.add(fname)
-            node_count[0] += 1
-
-            syms = self.find_symbol(fname)
-            if not syms:
-                return node
+        """Build a call graph for a function (same output as DoxygenXMLIndex).
 
-            sym = syms[0]
-            if exclude_kinds and sym.kind in exclude_kinds:
-                return node
-
-            node["kind"] = sym.kind
-            node["file"] = sym.file
-            node["line"] = sym.line
-
-            if dir_ in ("calls", "both"):
-                for ref in sym.references:
-                    if max_nodes > 0 and node_count[0] >= max_nodes:
-                        break
-                    if ref not in visited:
-                        node["calls"].append(_traverse(ref, d - 1, dir_))
-                    else:
-                        node["calls"].append({"name": ref, "calls": [], "callers": [], "cycle": True})
-
-            if dir_ in ("callers", "both"):
-                for ref in sym.referenced_by:
-                    if max_nodes > 0 and node_count[0] >= max_nodes:
-                        break
-                    if ref not in visited:
-                        node["callers"].append(_traverse(ref, d - 1, dir_))
-                    else:
-                        node["callers"].append({"name": ref, "calls": [], "callers": [], "cycle": True})
-
-            return node
-
-        result = _traverse(name, depth, direction)
-        truncated = max_nodes > 0 and node_count[0] >= max_nodes
-        result["_meta"] = {
-            "total_nodes": node_count[0],
-            "max_nodes": max_nodes,
-            "truncated": truncated,
-        }
-        if truncated:
-            result["_meta"]["hint"] = (
-                f"Graph truncated at {max_nodes} nodes. "
-                f"Use --max-nodes {max_nodes * 2} to see more."
-            )
-        return result
+        When a node is expanded, all of its unvisited neighbours are fetched
+        together (_prefetch_graph_nodes), so expanding a node costs two
+        queries rather than two per child.
+        """
+        return _walk_callgraph(
+            self._graph_node, name, depth, direction, max_nodes, exclude_kinds,
+            prefetch=self._prefetch_graph_nodes)
 
 
 # --- Output Formatting ---
@@ -918,43 +2008,60 @@ def format_symbol_text(sym: SymbolInfo) -> str:
     return "\n".join(lines)
 
 
-def format_callgraph_text(graph: dict, indent: int = 0, direction: str = "both") -> str:
-    prefix = "  " * indent
-    name = graph["name"]
-    cycle = " (cycle)" if graph.get("cycle") else ""
-    kind = graph.get("kind", "")
-    kind_str = f" [{kind}]" if kind else ""
-
-    lines = [f"{prefix}{name}{kind_str}{cycle}"]
+def _iter_callgraph_lines(graph: dict, indent: int = 0, direction: str = "both"):
+    """Yield the text rendering of a call graph one line at a time.
 
-    if direction in ("calls", "both") and graph.get("calls"):
-        lines.append(f"{prefix}  Calls:")
-        for child in graph["calls"]:
-            lines.append(format_callgraph_text(child, indent + 2, "calls"))
+    Walks the tree with an explicit stack (pre-order, children in list
+    order), so deep graphs neither hit the recursion limit nor build and
+    re-join a string per nesting level.
+    """
+    # Entries are either a pending node (graph, indent, direction) or a
+    # ready-made header line (str).
+    stack: list = [(graph, indent, direction)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+            continue
+        node, depth, node_dir = item
+        prefix = "  " * depth
+        cycle = " (cycle)" if node.get("cycle") else ""
+        kind = node.get("kind", "")
+        kind_str = f" [{kind}]" if kind else ""
+        yield f"{prefix}{node['name']}{kind_str}{cycle}"
+
+        # Push in reverse so "Calls" pops before "Called by", and children
+        # pop in their original order.
+        if node_dir in ("callers", "both") and node.get("callers"):
+            stack.extend((child, depth + 2, "callers") for child in reversed(node["callers"]))
+            stack.append(f"{prefix}  Called by:")
+        if node_dir in ("calls", "both") and node.get("calls"):
+            stack.extend((child, depth + 2, "calls") for child in reversed(node["calls"]))
+            stack.append(f"{prefix}  Calls:")
 
-    if direction in ("callers", "both") and graph.get("callers"):
-        lines.append(f"{prefix}  Called by:")
-        for child in graph["callers"]:
-            lines.append(format_callgraph_text(child, indent + 2, "callers"))
 
-    return "\n".join(lines)
+def format_callgraph_text(graph: dict, indent: int = 0, direction: str = "both") -> str:
+    return "\n".join(_iter_callgraph_lines(graph, indent, direction))
 
 
 def format_list_text(symbols: list[SymbolInfo]) -> str:
     if not symbols:
         return "No symbols found."
 
+    # basename() once per distinct file; many symbols share a file
+    basename_of = {f: os.path.basename(f) for f in {s.file for s in symbols}}
+    basenames = [basename_of[s.file] for s in symbols]
+
     # Find column widths
     max_name = max(len(s.name) for s in symbols)
     max_kind = max(len(s.kind) for s in symbols)
-    max_file = max(len(os.path.basename(s.file)) for s in symbols) if symbols else 0
+    max_file = max(map(len, basename_of.values()))
 
     header = f"{'Name':<{max_name}}  {'Kind':<{max_kind}}  {'File':<{max_file}}  Line"
     sep = "-" * len(header)
     lines = [header, sep]
 
-    for s in symbols:
-        fname = os.path.basename(s.file)
+    for s, fname in zip(symbols, basenames):
         lines.append(f"{s.name:<{max_name}}  {s.kind:<{max_kind}}  {fname:<{max_file}}  {s.line}")
 
     lines.append(f"\nTotal: {len(symbols)} symbols")
@@ -984,8 +2091,7 @@ def cmd_symbol(index, args) -> int:
         limit = getattr(args, "limit", 50)
         offset = getattr(args, "offset", 0)
         page, meta = _paginate(symbols, limit, offset)
-        output = {**meta, "results": [symbol_to_dict(s, compact) for s in page]}
-        print(json.dumps(output, indent=2))
+        _print_json_results(meta, (symbol_to_dict(s, compact) for s in page))
     else:
         for i, sym in enumerate(symbols):
             if i > 0:
@@ -998,18 +2104,10 @@ def cmd_callgraph(index, args) -> int:
     max_nodes = getattr(args, "max_nodes", 200)
     include_macros = getattr(args, "include_macros", False)
 
-    # Build exclude_kinds set
-    if include_macros:
-        exclude_kinds = set()
-    else:
-        exclude_kinds = {"define"}
-
-    # Add any explicit --exclude-kinds
-    extra_excludes = getattr(args, "exclude_kinds", None)
-    if extra_excludes:
-        exclude_kinds.update(extra_excludes)
-
-    exclude_kinds = exclude_kinds or None  # Convert empty set to None
+    # Build exclude_kinds once: macros unless --include-macros, plus any
+    # explicit --exclude-kinds; an empty set becomes None
+    exclude_kinds = frozenset(() if include_macros else ("define",)).union(
+        getattr(args, "exclude_kinds", None) or ()) or None
 
     graph = index.build_callgraph(
         args.func, depth=args.depth, direction=args.direction,
@@ -1017,9 +2115,9 @@ def cmd_callgraph(index, args) -> int:
     )
 
     if args.format == "json":
-        print(json.dumps(graph, indent=2))
+        print(_dumps(graph))
     else:
-        print(format_callgraph_text(graph, direction=args.direction))
+        sys.stdout.write("\n".join(_iter_callgraph_lines(graph, direction=args.direction)) + "\n")
         meta = graph.get("_meta", {})
         if meta.get("truncated"):
             print(f"\n[Truncated: {meta['total_nodes']} nodes shown, "
@@ -1064,8 +2162,13 @@ def cmd_body(index, args) -> int:
             print(msg)
         return 1
 
+    # Use the earlier of sym.line (declaration) and sym.body_start so that
+    # multiline signatures are included in the extracted body.
+    actual_start = min(sym.line, sym.body_start) if sym.line > 0 else sym.body_start
+    start = max(0, actual_start - 1)  # Convert 1-based to 0-based
+
     try:
-        all_lines = source_path.read_text().splitlines()
+        body_lines = _read_line_range(source_path, start, sym.body_end)
     except (OSError, UnicodeDecodeError) as e:
         msg = f"Error reading source file: {e}"
         if args.format == "json":
@@ -1074,25 +2177,18 @@ def cmd_body(index, args) -> int:
             print(msg)
         return 1
 
-    # Use the earlier of sym.line (declaration) and sym.body_start so that
-    # multiline signatures are included in the extracted body.
-    actual_start = min(sym.line, sym.body_start) if sym.line > 0 else sym.body_start
-    start = max(0, actual_start - 1)  # Convert 1-based to 0-based
-    end = min(len(all_lines), sym.body_end)
-    body_lines = all_lines[start:end]
-
     if args.format == "json":
-        print(json.dumps({
+        print(_dumps({
             "name": sym.name,
             "file": sym.file,
             "start_line": actual_start,
             "end_line": sym.body_end,
             "body": "\n".join(body_lines),
-        }, indent=2))
+        }))
     else:
         print(f"// {sym.file}:{actual_start}-{sym.body_end}")
-        for i, line in enumerate(body_lines, start=actual_start):
-            print(f"{i:>6}  {line}")
+        sys.stdout.write("".join(
+            f"{i:>6}  {line}\n" for i, line in enumerate(body_lines, start=actual_start)))
     return 0
 
 
@@ -1119,33 +2215,28 @@ def cmd_list(index, args) -> int:
                 print(result["hint"])
             return 1
 
-    symbols = index.get_all_symbols(scope=scope)
-
-    # Filter by kind
-    if kind:
-        symbols = [s for s in symbols if s.kind == kind]
-
-    # Filter by file
-    if file_filter:
-        symbols = [s for s in symbols if file_filter in s.file]
-
-    # Sort
-    symbols.sort(key=lambda s: (s.file, s.line))
-
     if count_only:
+        count = index.count_symbols(scope=scope, kind=kind, file_substr=file_filter)
         if args.format == "json":
-            print(json.dumps({"count": len(symbols)}))
+            print(json.dumps({"count": count}))
         else:
-            print(f"Count: {len(symbols)}")
+            print(f"Count: {count}")
         return 0
 
     if args.format == "json":
+        # Only the requested page is materialized (LIMIT/OFFSET on SQLite)
         limit = getattr(args, "limit", 50)
         offset = getattr(args, "offset", 0)
-        page, meta = _paginate(symbols, limit, offset)
-        output = {**meta, "results": [symbol_to_dict(s, compact) for s in page]}
-        print(json.dumps(output, indent=2))
+        page, total = index.page_symbols(scope=scope, kind=kind, file_substr=file_filter,
+                                         limit=limit, offset=offset)
+        meta = _page_meta(total, limit, offset, len(page))
+        page = index.load_details(page)
+        _print_json_results(meta, (symbol_to_dict(s, compact) for s in page))
     else:
+        # Filtering happens in the backend (in SQL for SQLite); the result is
+        # a fresh list, so sorting it in place leaves the backend's cache intact.
+        symbols = index.query_symbols(scope=scope, kind=kind, file_substr=file_filter)
+        symbols.sort(key=lambda s: (s.file, s.line))
         print(format_list_text(symbols))
     return 0
 
@@ -1154,7 +2245,6 @@ def cmd_search(index, args) -> int:
     scope = getattr(args, "scope", "")
     compact = getattr(args, "compact", False)
     count_only = getattr(args, "count", False)
-    symbols = index.get_all_symbols(scope=scope)
     pattern = args.pattern
 
     if args.regex:
@@ -1167,23 +2257,21 @@ def cmd_search(index, args) -> int:
             else:
                 print(msg)
             return 1
-        matches = [s for s in symbols if regex.search(s.name)]
+        if pattern.isascii() and re.escape(pattern) == pattern:
+            # No metacharacters: a plain case-insensitive substring match
+            matches = index.search_substring(pattern.lower(), scope=scope)
+        else:
+            matches = index.search_regex(regex, scope=scope)
     else:
-        # Case-insensitive substring search, with basic glob support
+        # Case-insensitive substring search, with glob support
         pat_lower = pattern.lower()
         if "*" in pat_lower or "?" in pat_lower:
-            # Convert glob to regex
-            regex_str = pat_lower.replace(".", r"\.").replace("*", ".*").replace("?", ".")
-            try:
-                regex = re.compile(f"^{regex_str}$", re.IGNORECASE)
-            except re.error:
-                regex = None
-            if regex:
-                matches = [s for s in symbols if regex.search(s.name)]
-            else:
-                matches = [s for s in symbols if pat_lower in s.name.lower()]
+            # fnmatch.translate escapes regex metacharacters (+, (, ...) and
+            # anchors the pattern, unlike a naive replace()-based conversion.
+            regex = re.compile(fnmatch.translate(pat_lower), re.IGNORECASE)
+            matches = index.search_regex(regex, scope=scope)
         else:
-            matches = [s for s in symbols if pat_lower in s.name.lower()]
+            matches = index.search_substring(pat_lower, scope=scope)
 
     matches.sort(key=lambda s: (s.file, s.line))
 
@@ -1198,8 +2286,8 @@ def cmd_search(index, args) -> int:
         limit = getattr(args, "limit", 50)
         offset = getattr(args, "offset", 0)
         page, meta = _paginate(matches, limit, offset)
-        output = {**meta, "results": [symbol_to_dict(s, compact) for s in page]}
-        print(json.dumps(output, indent=2))
+        page = index.load_details(page)
+        _print_json_results(meta, (symbol_to_dict(s, compact) for s in page))
     else:
         if matches:
             print(format_list_text(matches))
@@ -1225,7 +2313,7 @@ def cmd_stats(index, args) -> int:
         )
 
     if args.format == "json":
-        print(json.dumps(stats, indent=2))
+        print(_dumps(stats))
     else:
         print(f"Total symbols: {stats['total_symbols']}")
         print(f"Backend: {stats.get('index_backend', 'unknown')}")
@@ -1272,16 +2360,18 @@ def cmd_members(index, args) -> int:
                 {k: v for k, v in m.items() if v and v != 0} for m in page
             ],
         }
-        print(json.dumps(output, indent=2))
+        print(_dumps(output))
     else:
         print(f"Compound: {result['name']} ({result['kind']})")
         print(f"File:     {result['file']}:{result['line']}")
         if result["brief"]:
             print(f"Brief:    {result['brief']}")
         print(f"\nMembers ({len(result['members'])}):")
+        rows = []
         for m in result["members"]:
             line_str = f":{m['line']}" if m.get("line") else ""
-            print(f"  {m['type']} {m['name']}{line_str}  [{m['kind']}]")
+            rows.append(f"  {m['type']} {m['name']}{line_str}  [{m['kind']}]\n")
+        sys.stdout.write("".join(rows))
     return 0
 
 
@@ -1302,10 +2392,10 @@ def cmd_files(index, args) -> int:
         offset = getattr(args, "offset", 0)
         page, meta = _paginate(files, limit, offset)
         output = {**meta, "files": page}
-        print(json.dumps(output, indent=2))
+        print(_dumps(output))
     else:
-        for f in files:
-            print(f)
+        if files:
+            sys.stdout.write("\n".join(files) + "\n")
         print(f"\nTotal: {len(files)} files")
     return 0
 
@@ -1319,7 +2409,7 @@ def cmd_file(index, args) -> int:
     if not symbols:
         # Try fuzzy file matching
         all_files = index.get_all_files()
-        similar = difflib.get_close_matches(file_path, all_files, n=5, cutoff=0.4)
+        similar = _close_matches(file_path, all_files, n=5, cutoff=0.4)
         error = {"error": f"No symbols found in file: {file_path}"}
         if similar:
             error["similar_files"] = similar
@@ -1343,12 +2433,9 @@ def cmd_file(index, args) -> int:
         limit = getattr(args, "limit", 50)
         offset = getattr(args, "offset", 0)
         page, meta = _paginate(symbols, limit, offset)
-        output = {
-            "file": file_path,
-            **meta,
-            "results": [symbol_to_dict(s, compact) for s in page],
-        }
-        print(json.dumps(output, indent=2))
+        page = index.load_details(page)
+        _print_json_results({"file": file_path, **meta},
+                            (symbol_to_dict(s, compact) for s in page))
     else:
         print(f"Symbols in {file_path}:")
         print(format_list_text(symbols))